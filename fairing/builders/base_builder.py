@@ -1,7 +1,5 @@
 import logging
 
-from kubernetes import client
-
 from fairing.builders.builder import BuilderInterface
 from fairing.constants import constants
 from fairing.cloud import gcp
@@ -40,6 +38,9 @@ class BaseBuilder(BuilderInterface): #pylint:disable=too-many-instance-attribute
 
     def generate_pod_spec(self):
         """return a V1PodSpec initialized with the proper container"""
+        # Deferred so that importing fairing doesn't load the kubernetes
+        # package until a build actually targets the cluster.
+        from kubernetes import client
         return client.V1PodSpec(
             containers=[client.V1Container(
                 name='model',
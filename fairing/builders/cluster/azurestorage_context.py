@@ -1,7 +1,5 @@
 import uuid
 
-from kubernetes import client
-
 from fairing import utils
 from fairing.builders.cluster.context_source import ContextSourceInterface
 from fairing.cloud import azure
@@ -52,6 +50,7 @@ class StorageContextSource(ContextSourceInterface):
         azure.delete_storage_creds_secret(self.namespace, self.context_hash)
 
     def generate_pod_spec(self, image_name, push):  # pylint:disable=arguments-differ
+        from kubernetes import client
         args = ["--dockerfile=Dockerfile",
                 "--destination={}".format(image_name),
                 "--context={}".format(self.context_path)]
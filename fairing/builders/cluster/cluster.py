@@ -1,8 +1,6 @@
 import logging
 import uuid
 
-from kubernetes import client
-
 import fairing
 from fairing.builders.base_builder import BaseBuilder
 from fairing.builders import dockerfile
@@ -51,6 +49,7 @@ class ClusterBuilder(BaseBuilder):
         self.namespace = namespace or fairing.utils.get_default_target_namespace()
 
     def build(self):
+        from kubernetes import client
         logging.info("Building image using cluster builder.")
         install_reqs_before_copy = self.preprocessor.is_requirements_txt_file_present()
         dockerfile_path = dockerfile.write_dockerfile(
@@ -3,7 +3,7 @@ import os
 from fairing.cloud import gcp
 from fairing import utils
 from fairing.constants import constants
-from fairing.kubernetes.manager import client, KubeManager
+from fairing.kubernetes.manager import KubeManager
 from fairing.builders.cluster.context_source import ContextSourceInterface
 
 
@@ -33,6 +33,7 @@ class GCSContextSource(ContextSourceInterface):
         pass
 
     def generate_pod_spec(self, image_name, push):  # pylint:disable=arguments-differ
+        from kubernetes import client
         args = ["--dockerfile=Dockerfile",
                 "--destination=" + image_name,
                 "--context=" + self.uploaded_context_url,
@@ -1,6 +1,6 @@
 from fairing.cloud import aws
 from fairing import utils
-from fairing.kubernetes.manager import client, KubeManager
+from fairing.kubernetes.manager import KubeManager
 from fairing.builders.cluster.context_source import ContextSourceInterface
 
 
@@ -32,6 +32,7 @@ class S3ContextSource(ContextSourceInterface):
         pass
 
     def generate_pod_spec(self, image_name, push):  # pylint:disable=arguments-differ
+        from kubernetes import client
         args = ["--dockerfile=Dockerfile",
                 "--destination=" + image_name,
                 "--context=" + self.uploaded_context_url]
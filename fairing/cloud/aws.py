@@ -3,7 +3,6 @@ import logging
 import re
 from botocore.exceptions import ClientError
 from fairing.constants import constants
-from kubernetes import client
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +50,7 @@ def add_aws_credentials_if_exists(kube_manager, pod_spec, namespace):
 
 
 def add_aws_credentials(kube_manager, pod_spec, namespace):
+    from kubernetes import client
     if not kube_manager.secret_exists(constants.AWS_CREDS_SECRET_NAME, namespace):
         raise ValueError('Unable to mount credentials: Secret aws-secret not found in namespace {}'
                          .format(namespace))
@@ -84,6 +84,7 @@ def add_aws_credentials(kube_manager, pod_spec, namespace):
 
 
 def add_ecr_config(kube_manager, pod_spec, namespace):
+    from kubernetes import client
     if not kube_manager.secret_exists('ecr-config', namespace):
         secret = client.V1Secret(metadata=client.V1ObjectMeta(name='ecr-config'),
                                  string_data={
@@ -11,7 +11,6 @@ from azure.mgmt.storage.models import Sku
 from azure.mgmt.storage.models import SkuName
 from azure.mgmt.storage.models import Kind
 from azure.storage.file import FileService
-from kubernetes import client
 
 from fairing.constants import constants
 from fairing.kubernetes.manager import KubeManager
@@ -126,6 +125,7 @@ class AzureFileUploader(object):
 # Get credentials for a service principal which has permissions to
 # create or access the storage account for Azure Files
 def get_azure_credentials(namespace):
+    from kubernetes import client
     secret_name = constants.AZURE_CREDS_SECRET_NAME
     if not KubeManager().secret_exists(secret_name, namespace):
         raise Exception("Secret '{}' not found in namespace '{}'".format(secret_name, namespace))
@@ -149,6 +149,7 @@ def get_plain_secret_value(secret_data, key):
 
 # Create a secret with the credentials to access the storage account for Azure Files
 def create_storage_creds_secret(namespace, context_hash, storage_account_name, storage_key):
+    from kubernetes import client
     secret_name = constants.AZURE_STORAGE_CREDS_SECRET_NAME_PREFIX + context_hash.lower()
     logging.info(
         "Creating secret '{}' in namespace '{}'"
@@ -165,6 +166,7 @@ def create_storage_creds_secret(namespace, context_hash, storage_account_name, s
 
 # Delete the secret with the credentials to access the storage account for Azure Files
 def delete_storage_creds_secret(namespace, context_hash):
+    from kubernetes import client
     secret_name = constants.AZURE_STORAGE_CREDS_SECRET_NAME_PREFIX + context_hash.lower()
     logging.info(
         "Deleting secret '{}' from namespace '{}'"
@@ -179,6 +181,7 @@ def is_acr_registry(registry):
 
 # Mount Docker config so the pod can access Azure Container Registry
 def add_acr_config(kube_manager, pod_spec, namespace):
+    from kubernetes import client
     secret_name = constants.AZURE_ACR_CREDS_SECRET_NAME
     if not kube_manager.secret_exists(secret_name, namespace):
         raise Exception("Secret '{}' not found in namespace '{}'".format(secret_name, namespace))
@@ -204,6 +207,7 @@ def add_acr_config(kube_manager, pod_spec, namespace):
 
 # Mount Azure Files shared folder so the pod can access its files with a local path
 def add_azure_files(kube_manager, pod_spec, namespace):
+    from kubernetes import client
     context_hash = pod_spec.containers[0].args[1].split(':')[-1]
     secret_name = constants.AZURE_STORAGE_CREDS_SECRET_NAME_PREFIX + context_hash.lower()
     if not kube_manager.secret_exists(secret_name, namespace):
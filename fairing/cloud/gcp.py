@@ -2,7 +2,6 @@ import google.auth
 from google.cloud import storage
 from google.cloud.exceptions import NotFound
 from fairing.constants import constants
-from kubernetes import client
 import logging
 
 import os
@@ -69,6 +68,7 @@ def add_gcp_credentials_if_exists(kube_manager, pod_spec, namespace):
 
 
 def add_gcp_credentials(kube_manager, pod_spec, namespace):
+    from kubernetes import client
     if not kube_manager.secret_exists(constants.GCP_CREDS_SECRET_NAME, namespace):
         raise ValueError('Unable to mount credentials: '
                          + 'Secret user-gcp-sa not found in namespace {}'.format(namespace))
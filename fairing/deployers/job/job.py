@@ -2,8 +2,6 @@ import logging
 import json
 import uuid
 
-from kubernetes import client as k8s_client
-
 from fairing import utils
 from fairing.constants import constants
 from fairing.kubernetes.manager import KubeManager
@@ -57,6 +55,7 @@ class Job(DeployerInterface): #pylint:disable=too-many-instance-attributes
         pod_template_spec.spec.containers[0].name = 'fairing-job'
         self.deployment_spec = self.generate_deployment_spec(pod_template_spec)
         if self.output:
+            from kubernetes import client as k8s_client
             api = k8s_client.ApiClient()
             job_output = api.sanitize_for_serialization(self.deployment_spec)
             print(json.dumps(job_output))
@@ -76,6 +75,7 @@ class Job(DeployerInterface): #pylint:disable=too-many-instance-attributes
     def generate_pod_template_spec(self, pod_spec):
         """Generate a V1PodTemplateSpec initiazlied with correct metadata
             and with the provided pod_spec"""
+        from kubernetes import client as k8s_client
         if not isinstance(pod_spec, k8s_client.V1PodSpec):
             raise TypeError('pod_spec must be a V1PodSpec, but got %s'
                             % type(pod_spec))
@@ -86,6 +86,7 @@ class Job(DeployerInterface): #pylint:disable=too-many-instance-attributes
     def generate_deployment_spec(self, pod_template_spec):
         """Generate a V1Job initialized with correct completion and
          parallelism (for HP search) and with the provided V1PodTemplateSpec"""
+        from kubernetes import client as k8s_client
         if not isinstance(pod_template_spec, k8s_client.V1PodTemplateSpec):
             raise TypeError("""pod_template_spec must be a V1PodTemplateSpec,
                 but got %s""" % type(pod_template_spec))
@@ -117,6 +118,7 @@ class Job(DeployerInterface): #pylint:disable=too-many-instance-attributes
             self.do_cleanup()
 
     def do_cleanup(self):
+        from kubernetes import client as k8s_client
         logger.warning("Cleaning up job {}...".format(self._created_job.metadata.name))
         k8s_client.BatchV1Api().delete_namespaced_job(
             self._created_job.metadata.name,
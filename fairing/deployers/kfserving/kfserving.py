@@ -1,8 +1,6 @@
 import uuid
 import logging
 
-from kubernetes import client as k8s_client
-
 from fairing.constants import constants
 from fairing.deployers.deployer import DeployerInterface
 from fairing.kubernetes.manager import KubeManager
@@ -75,6 +73,7 @@ class KFServing(DeployerInterface):
         return kfservice_name
 
     def generate_kfservice(self):
+        from kubernetes import client as k8s_client
 
         spec = {}
         spec['default'] = {}
@@ -2,9 +2,6 @@ import json
 import uuid
 import logging
 
-from kubernetes import client as k8s_client
-from kubernetes.client.rest import ApiException
-
 from fairing.constants import constants
 from fairing.deployers.job.job import Job
 
@@ -32,6 +29,7 @@ class Serving(Job):
         self.pod_spec_mutators = pod_spec_mutators or []
 
     def deploy(self, pod_spec):
+        from kubernetes import client as k8s_client
         self.job_id = str(uuid.uuid1())
         self.labels['fairing-id'] = self.job_id
         for fn in self.pod_spec_mutators:
@@ -69,6 +67,7 @@ class Serving(Job):
         return url
 
     def generate_deployment_spec(self, pod_template_spec):
+        from kubernetes import client as k8s_client
         return k8s_client.V1Deployment(
             api_version="apps/v1",
             kind="Deployment",
@@ -85,6 +84,7 @@ class Serving(Job):
         )
 
     def generate_service_spec(self):
+        from kubernetes import client as k8s_client
         return k8s_client.V1Service(
             api_version="v1",
             kind="Service",
@@ -103,6 +103,8 @@ class Serving(Job):
         )
 
     def delete(self):
+        from kubernetes import client as k8s_client
+        from kubernetes.client.rest import ApiException
         v1_api = k8s_client.CoreV1Api()
         try:
             v1_api.delete_namespaced_service(self.service.metadata.name, #pylint:disable=no-value-for-parameter
@@ -114,7 +116,7 @@ class Serving(Job):
             logger.error("Not able to delete service: {}/{}".format(self.service.metadata.namespace,
                                                                     self.service.metadata.name))
         try:
-            api_instance = k8s_client.ExtensionsV1beta1Api()
+            api_instance = k8s_client.AppsV1Api()
             del_opts = k8s_client.V1DeleteOptions(propagation_policy="Foreground")
             api_instance.delete_namespaced_deployment(self.deployment.metadata.name,
                                                       self.deployment.metadata.namespace,
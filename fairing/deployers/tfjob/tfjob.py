@@ -1,5 +1,4 @@
 import logging
-from kubernetes import client as k8s_client
 
 from fairing.constants import constants
 from fairing.deployers.job.job import Job
@@ -25,6 +24,7 @@ class TfJob(Job):
 
     def generate_deployment_spec(self, pod_template_spec):
         """Returns a TFJob template"""
+        from kubernetes import client as k8s_client
         self.set_container_name(pod_template_spec)
 
         worker_replica_spec = {}
@@ -0,0 +1,244 @@
+import asyncio
+import sys
+
+from kubernetes_asyncio import client, config, watch
+
+from fairing.utils import is_running_in_k8s
+from fairing.kubernetes.utils import format_label_selector
+from fairing.kubernetes.manager import MAX_STREAM_BYTES
+from fairing.constants import constants
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+def run_sync(coro):
+    """Run a coroutine to completion from synchronous code."""
+    return asyncio.run(coro)
+
+
+class AsyncKubeManager(object):
+    """Handles communication with Kubernetes' client using kubernetes_asyncio.
+
+    Mirrors KubeManager but every method is a coroutine, so many API calls
+    (job submissions, watches, log streams) can run concurrently in a single
+    event loop instead of blocking a thread each. All calls share one
+    ApiClient — and therefore one aiohttp connection pool — which is opened
+    on first use; use the manager as an async context manager or call
+    aclose() when done. Synchronous callers can wrap individual calls with
+    run_sync().
+    """
+
+    def __init__(self):
+        self._api_client = None
+
+    async def _ensure_client(self):
+        """Load the cluster config and build the shared client once."""
+        if self._api_client is not None:
+            return
+        if is_running_in_k8s():
+            config.load_incluster_config()
+        else:
+            await config.load_kube_config()
+        self._api_client = client.ApiClient()
+        self._batch = client.BatchV1Api(self._api_client)
+        self._core = client.CoreV1Api(self._api_client)
+        self._apps = client.AppsV1Api(self._api_client)
+        self._custom = client.CustomObjectsApi(self._api_client)
+
+    async def aclose(self):
+        """Close the shared ApiClient and its aiohttp session."""
+        if self._api_client is not None:
+            await self._api_client.close()
+            self._api_client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def create_job(self, namespace, job):
+        """Creates a V1Job in the specified namespace"""
+        await self._ensure_client()
+        return await self._batch.create_namespaced_job(namespace, job)
+
+    async def batch_create_jobs(self, namespace, jobs):
+        """Create many V1Jobs concurrently in the specified namespace.
+
+        All creates are dispatched at once with asyncio.gather over the
+        shared connection pool, so N submissions complete in roughly the
+        slowest round-trip rather than the sum of them. Results are
+        returned in input order.
+        """
+        return await asyncio.gather(*(self.create_job(namespace, job) for job in jobs))
+
+    async def batch_create_tf_jobs(self, namespace, jobs):
+        """Create many TFJobs concurrently in the specified namespace"""
+        return await asyncio.gather(*(self.create_tf_job(namespace, job) for job in jobs))
+
+    async def create_tf_job(self, namespace, job):
+        """Create the provided TFJob in the specified namespace"""
+        await self._ensure_client()
+        try:
+            return await self._custom.create_namespaced_custom_object(
+                constants.TF_JOB_GROUP,
+                constants.TF_JOB_VERSION,
+                namespace,
+                constants.TF_JOB_PLURAL,
+                job
+            )
+        except client.rest.ApiException:
+            raise RuntimeError("Failed to create TFJob. Perhaps the CRD TFJob version "
+                               "{} in not installed?".format(constants.TF_JOB_VERSION))
+
+    async def delete_tf_job(self, name, namespace):
+        """Delete the provided TFJob in the specified namespace"""
+        await self._ensure_client()
+        return await self._custom.delete_namespaced_custom_object(
+            constants.TF_JOB_GROUP,
+            constants.TF_JOB_VERSION,
+            namespace,
+            constants.TF_JOB_PLURAL,
+            name,
+            body=client.V1DeleteOptions())
+
+    async def create_deployment(self, namespace, deployment):
+        """Create an V1Deployment in the specified namespace"""
+        await self._ensure_client()
+        return await self._apps.create_namespaced_deployment(namespace, deployment)
+
+    async def create_kfserving(self, namespace, kfservice):
+        """Create the provided KFServing in the specified namespace"""
+        await self._ensure_client()
+        try:
+            return await self._custom.create_namespaced_custom_object(
+                constants.KFSERVING_GROUP,
+                constants.KFSERVING_VERSION,
+                namespace,
+                constants.KFSERVING_PLURAL,
+                kfservice)
+        except client.rest.ApiException:
+            raise RuntimeError("Failed to create KFService. Perhaps the CRD KFServing version "
+                               "{} is not installed?".format(constants.KFSERVING_VERSION))
+
+    async def delete_kfserving(self, name, namespace):
+        """Delete the provided KFServing in the specified namespace"""
+        await self._ensure_client()
+        return await self._custom.delete_namespaced_custom_object(
+            constants.KFSERVING_GROUP,
+            constants.KFSERVING_VERSION,
+            namespace,
+            constants.KFSERVING_PLURAL,
+            name,
+            body=client.V1DeleteOptions())
+
+    async def delete_job(self, name, namespace):
+        """Delete the specified job"""
+        await self._ensure_client()
+        await self._batch.delete_namespaced_job(
+            name,
+            namespace,
+            body=client.V1DeleteOptions())
+
+    async def delete_deployment(self, name, namespace):
+        await self._ensure_client()
+        await self._apps.delete_namespaced_deployment(
+            name,
+            namespace,
+            body=client.V1DeleteOptions())
+
+    async def secret_exists(self, name, namespace):
+        """Check whether the named secret exists in the specified namespace"""
+        await self._ensure_client()
+        try:
+            await self._core.read_namespaced_secret(name, namespace)
+            return True
+        except client.rest.ApiException as e:
+            if e.status == 404:
+                return False
+            raise
+
+    async def create_secret(self, namespace, secret):
+        await self._ensure_client()
+        return await self._core.create_namespaced_secret(namespace, secret)
+
+    async def get_service_external_endpoint(self, name, namespace, selectors=None): #pylint:disable=inconsistent-return-statements
+        await self._ensure_client()
+        label_selector_str = format_label_selector(selectors)
+        print("Waiting for prediction endpoint to come up...")
+        try:
+            # The Watch owns an aiohttp session of its own; the async
+            # context manager closes it even when we return mid-stream.
+            async with watch.Watch().stream(
+                    self._core.list_namespaced_service,
+                    namespace=namespace,
+                    label_selector=label_selector_str) as stream:
+                async for event in stream:
+                    svc = event['object']
+                    logger.debug("Event: %s %s",
+                                 event['type'],
+                                 event['object'])
+                    ing = svc.status.load_balancer.ingress
+                    if ing is not None and len(ing) > 0: #pylint:disable=len-as-condition
+                        url = "http://{}:5000/predict".format(ing[0].ip or ing[0].hostname)
+                        return url
+        except ValueError as v:
+            logger.error("error getting status for {} {}".format(name, str(v)))
+        except client.rest.ApiException as e:
+            logger.error("error getting status for {} {}".format(name, str(e)))
+
+    async def log(self, name, namespace, selectors=None, container='', follow=True):
+        """Stream logs for the pod behind the job to stdout"""
+        await self._ensure_client()
+        label_selector_str = format_label_selector(selectors)
+        v1 = self._core
+        tail = None
+        try:
+            async with watch.Watch().stream(v1.list_namespaced_pod,
+                                            namespace=namespace,
+                                            label_selector=label_selector_str) as stream:
+                async for event in stream:
+                    pod = event['object']
+                    cs = (pod.status.container_statuses or [None])[0]
+                    phase = pod.status.phase
+                    logger.debug("Event: %s %s %s",
+                                 event['type'],
+                                 pod.metadata.name,
+                                 phase)
+                    if phase == 'Pending':
+                        logger.warning('Waiting for {} to start...'.format(pod.metadata.name))
+                        continue
+                    failed = (event['type'] == 'DELETED'
+                              or phase == 'Failed'
+                              or (cs is not None and cs.state and cs.state.waiting))
+                    started = ((phase == 'Running' and cs is not None and cs.ready)
+                               or phase == 'Succeeded')
+                    if not failed and not started:
+                        continue
+                    if failed:
+                        terminated = cs.state.terminated if cs is not None and cs.state else None
+                        logger.error("Failed to launch %s, reason: %s, message: %s",
+                                     pod.metadata.name,
+                                     terminated.reason if terminated is not None else None,
+                                     terminated.message if terminated is not None else None)
+                    tail = await v1.read_namespaced_pod_log(
+                        pod.metadata.name,
+                        namespace,
+                        follow=False if failed else follow,
+                        _preload_content=False,
+                        pretty='pretty',
+                        container=container)
+                    break
+        except ValueError as v:
+            logger.error("error getting status for {} {}".format(name, str(v)))
+        except client.rest.ApiException as e:
+            logger.error("error getting status for {} {}".format(name, str(e)))
+        if tail is not None:
+            out = sys.stdout.buffer
+            try:
+                async for chunk in tail.content.iter_chunked(MAX_STREAM_BYTES):
+                    out.write(chunk)
+                    out.flush()
+            finally:
+                tail.release()
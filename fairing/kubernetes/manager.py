@@ -1,179 +1,564 @@
-from kubernetes import client, config, watch
+import itertools
+import sys
+import threading
+import time
+from concurrent import futures
+
+import urllib3
 from fairing.utils import is_running_in_k8s
+from fairing.kubernetes.utils import format_label_selector
 from fairing.constants import constants
 
 import logging
 logger = logging.getLogger(__name__)
 
-MAX_STREAM_BYTES = 1024
+MAX_STREAM_BYTES = 64 * 1024
+
+# (group, version, plural) per custom-resource kind, resolved once at
+# import instead of re-walking the constants attribute chains per call.
+_CRDS = {
+    'tfjob': (constants.TF_JOB_GROUP,
+              constants.TF_JOB_VERSION,
+              constants.TF_JOB_PLURAL),
+    'kfserving': (constants.KFSERVING_GROUP,
+                  constants.KFSERVING_VERSION,
+                  constants.KFSERVING_PLURAL),
+}
+
+
+def _load_kubernetes():
+    """Import the kubernetes package on first use.
+
+    The swagger-generated client defines hundreds of model classes, so
+    importing it eagerly slows down every `import fairing` even for code
+    paths that never talk to a cluster.
+    """
+    global client, config, watch #pylint:disable=global-variable-undefined
+    if 'client' in globals():
+        return
+    import kubernetes
+    client = kubernetes.client
+    config = kubernetes.config
+    watch = kubernetes.watch
+
+
+def __getattr__(name):
+    # Keep `from fairing.kubernetes.manager import client` working for
+    # callers that reuse our client module.
+    if name in ('client', 'config', 'watch'):
+        _load_kubernetes()
+        return globals()[name]
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+class _ServiceInformer(object):
+    """Shared informer over the services matching one (namespace, selector).
+
+    Runs a single list+watch in a background thread and keeps only each
+    service's load-balancer ingress, keyed by uid, so repeated endpoint
+    lookups are answered from the local cache instead of opening a fresh
+    watch (and paying its initial LIST) per call.
+    """
+
+    # Consecutive watch failures tolerated before the informer gives up
+    # and surfaces the error to waiters.
+    MAX_WATCH_FAILURES = 5
+
+    def __init__(self, api_instance, namespace, label_selector):
+        _load_kubernetes()
+        self._api_instance = api_instance
+        self._namespace = namespace
+        self._label_selector = label_selector
+        self._ingress_by_uid = {}
+        self._has_ingress = threading.Event()
+        self.error = None
+        # Live lookups sharing this informer; maintained by KubeManager
+        # under its informer lock.
+        self.refs = 0
+        self._stop_requested = False
+        self._watch = watch.Watch()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background watch; a stopped informer cannot be reused.
+
+        The watch thread may block inside a read for up to its
+        timeout_seconds before noticing, but it will not reconnect.
+        """
+        self._stop_requested = True
+        self._watch.stop()
+
+    def _seed(self):
+        """Prime the cache with one selector-scoped LIST and return its RV.
+
+        Watching from the returned resourceVersion means the watch itself
+        streams only deltas ("watch-from-now") instead of synthesising an
+        ADDED event per existing object. Newer apiservers can suppress the
+        bootstrap entirely with send_initial_events=False, but this
+        list-then-watch fallback works on every cluster version.
+        """
+        svcs = self._api_instance.list_namespaced_service(
+            self._namespace,
+            label_selector=self._label_selector)
+        for svc in svcs.items:
+            ing = svc.status.load_balancer.ingress
+            self._ingress_by_uid[svc.metadata.uid] = ing
+            if ing:
+                self._has_ingress.set()
+        return svcs.metadata.resource_version
+
+    def _run(self):
+        # Any error the watch loop can't recover from is recorded and
+        # wakes the waiters; a silently dead thread would leave
+        # wait_for_ingress blocked with nobody to signal it.
+        try:
+            self._watch_loop()
+        except Exception as e: #pylint:disable=broad-except
+            logger.error("error watching services: %s", str(e))
+            self.error = e
+            self._has_ingress.set()
+
+    def _watch_loop(self):
+        w = self._watch
+        try:
+            rv = self._seed()
+        except client.rest.ApiException as e:
+            logger.debug("error seeding service cache: %s", str(e))
+            rv = None
+        failures = 0
+        while not self._stop_requested:
+            try:
+                # Track the resourceVersion of every event (bookmarks
+                # included) so a dropped connection resumes where it left
+                # off instead of re-listing every matching service.
+                for event in w.stream(self._api_instance.list_namespaced_service,
+                                      namespace=self._namespace,
+                                      label_selector=self._label_selector,
+                                      resource_version=rv,
+                                      allow_watch_bookmarks=True,
+                                      timeout_seconds=300):
+                    if event['type'] == 'BOOKMARK':
+                        # Bookmark objects are not deserialized by the
+                        # client; they stay plain dicts.
+                        rv = event['object']['metadata']['resourceVersion']
+                        continue
+                    svc = event['object']
+                    rv = svc.metadata.resource_version
+                    logger.debug("Event: %s %s",
+                                 event['type'],
+                                 svc.metadata.name)
+                    if event['type'] == 'DELETED':
+                        self._ingress_by_uid.pop(svc.metadata.uid, None)
+                        continue
+                    ing = svc.status.load_balancer.ingress
+                    self._ingress_by_uid[svc.metadata.uid] = ing
+                    if ing:
+                        self._has_ingress.set()
+                failures = 0
+            except client.rest.ApiException as e:
+                if e.status == 410:
+                    # Our resourceVersion expired; a cheap limit=1 LIST
+                    # refreshes it without re-downloading every service.
+                    rv = self._refresh_resource_version()
+                else:
+                    failures += 1
+                    if failures >= self.MAX_WATCH_FAILURES:
+                        raise
+                    logger.debug("service watch dropped, restarting: %s", str(e))
+            time.sleep(1)
+
+    def _refresh_resource_version(self):
+        try:
+            svcs = self._api_instance.list_namespaced_service(
+                self._namespace,
+                label_selector=self._label_selector,
+                limit=1)
+            return svcs.metadata.resource_version
+        except client.rest.ApiException as e:
+            logger.debug("error refreshing resourceVersion: %s", str(e))
+            return None
+
+    def _lookup(self):
+        for ing in self._ingress_by_uid.values():
+            if ing:
+                return ing
+        return None
+
+    def wait_for_ingress(self, timeout=None):
+        """Return the first populated ingress, waiting for the watch if needed.
+
+        Returns None on timeout or when the watch died; in the latter case
+        the terminal exception is available on self.error.
+        """
+        ing = self._lookup()
+        if ing is not None:
+            return ing
+        self._has_ingress.wait(timeout)
+        return self._lookup()
+
 
 class KubeManager(object):
     """Handles communication with Kubernetes' client."""
 
     def __init__(self):
+        _load_kubernetes()
         if is_running_in_k8s():
             config.load_incluster_config()
         else:
             config.load_kube_config()
+        # Share one ApiClient (and its urllib3 connection pool) across all
+        # API groups so sequential calls reuse the same TLS connection.
+        # The pool is widened so concurrent calls (batch creates, watches
+        # alongside log streams) don't queue behind each other, and retries
+        # back off instead of hammering the apiserver. urllib3 only speaks
+        # HTTP/1.1; callers wanting multiplexed streams over one connection
+        # should use the aiohttp-based AsyncKubeManager instead.
+        cfg = client.Configuration.get_default_copy()
+        cfg.connection_pool_maxsize = 50
+        cfg.retries = urllib3.util.retry.Retry(total=3, backoff_factor=0.2)
+        client.Configuration.set_default(cfg)
+        self._api_client = client.ApiClient(cfg)
+        self._batch = client.BatchV1Api(self._api_client)
+        self._core = client.CoreV1Api(self._api_client)
+        self._apps = client.AppsV1Api(self._api_client)
+        self._custom = client.CustomObjectsApi(self._api_client)
+        self._svc_informers = {}
+        self._svc_informers_lock = threading.Lock()
+        self._log_watermarks = {}
+        self._crd_cache = {}
 
     def create_job(self, namespace, job):
         """Creates a V1Job in the specified namespace"""
-        api_instance = client.BatchV1Api()
-        return api_instance.create_namespaced_job(namespace, job)
+        return self._batch.create_namespaced_job(namespace, job)
 
-    def create_tf_job(self, namespace, job):
-        """Create the provided TFJob in the specified namespace"""
-        api_instance = client.CustomObjectsApi()
+    def batch_create_jobs(self, namespace, jobs, max_workers=None):
+        """Create many V1Jobs concurrently via a thread pool.
+
+        Results are returned in input order. For a fully asynchronous
+        variant see AsyncKubeManager.batch_create_jobs.
+        """
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda job: self.create_job(namespace, job), jobs))
+
+    def _crd_installed(self, crd_name):
+        """Probe once whether the named CRD exists, caching the answer.
+
+        With the result cached, submissions against a cluster that lacks
+        the CRD fail immediately instead of paying a round-trip plus
+        exception handling per attempt.
+        """
+        installed = self._crd_cache.get(crd_name)
+        if installed is None:
+            try:
+                client.ApiextensionsV1Api(self._api_client) \
+                    .read_custom_resource_definition(crd_name)
+                installed = True
+            except client.rest.ApiException as e:
+                # Only a 404 is a definitive absence. Anything else (e.g.
+                # RBAC denying cluster-scoped CRD reads) is inconclusive:
+                # cache True so the probe runs at most once and the create
+                # attempt stays the arbiter.
+                installed = e.status != 404
+            self._crd_cache[crd_name] = installed
+        return installed
+
+    def _create_crd(self, kind, namespace, body, error_message):
+        """Create a custom object of the given _CRDS kind"""
+        group, version, plural = _CRDS[kind]
+        if not self._crd_installed("{}.{}".format(plural, group)):
+            raise RuntimeError(error_message)
         try:
-            return api_instance.create_namespaced_custom_object(
-                constants.TF_JOB_GROUP,
-                constants.TF_JOB_VERSION,
-                namespace,
-                constants.TF_JOB_PLURAL,
-                job
-            )
+            return self._custom.create_namespaced_custom_object(
+                group, version, namespace, plural, body)
         except client.rest.ApiException:
-            raise RuntimeError("Failed to create TFJob. Perhaps the CRD TFJob version "
-                               "{} in not installed?".format(constants.TF_JOB_VERSION))
+            raise RuntimeError(error_message)
+
+    def _delete_crd(self, kind, name, namespace):
+        """Delete the named custom object of the given _CRDS kind"""
+        group, version, plural = _CRDS[kind]
+        return self._custom.delete_namespaced_custom_object(
+            group, version, namespace, plural, name, client.V1DeleteOptions())
+
+    def create_tf_job(self, namespace, job):
+        """Create the provided TFJob in the specified namespace"""
+        return self._create_crd(
+            'tfjob', namespace, job,
+            "Failed to create TFJob. Perhaps the CRD TFJob version "
+            "{} in not installed?".format(constants.TF_JOB_VERSION))
 
     def delete_tf_job(self, name, namespace):
         """Delete the provided TFJob in the specified namespace"""
-        api_instance = client.CustomObjectsApi()
-        return api_instance.delete_namespaced_custom_object(
-            constants.TF_JOB_GROUP,
-            constants.TF_JOB_VERSION,
-            namespace,
-            constants.TF_JOB_PLURAL,
-            name,
-            client.V1DeleteOptions())
+        return self._delete_crd('tfjob', name, namespace)
 
     def create_deployment(self, namespace, deployment):
         """Create an V1Deployment in the specified namespace"""
-        api_instance = client.AppsV1Api()
-        return api_instance.create_namespaced_deployment(namespace, deployment)
+        return self._apps.create_namespaced_deployment(namespace, deployment)
 
     def create_kfserving(self, namespace, kfservice):
         """Create the provided KFServing in the specified namespace"""
-        api_instance = client.CustomObjectsApi()
-        try:
-            return api_instance.create_namespaced_custom_object(
-                constants.KFSERVING_GROUP,
-                constants.KFSERVING_VERSION,
-                namespace,
-                constants.KFSERVING_PLURAL,
-                kfservice)
-        except client.rest.ApiException:
-            raise RuntimeError("Failed to create KFService. Perhaps the CRD KFServing version "
-                               "{} is not installed?".format(constants.KFSERVING_VERSION))
+        return self._create_crd(
+            'kfserving', namespace, kfservice,
+            "Failed to create KFService. Perhaps the CRD KFServing version "
+            "{} is not installed?".format(constants.KFSERVING_VERSION))
 
     def delete_kfserving(self, name, namespace):
         """Delete the provided KFServing in the specified namespace"""
-        api_instance = client.CustomObjectsApi()
-        return api_instance.delete_namespaced_custom_object(
-            constants.KFSERVING_GROUP,
-            constants.KFSERVING_VERSION,
-            namespace,
-            constants.KFSERVING_PLURAL,
-            name,
-            client.V1DeleteOptions())
+        return self._delete_crd('kfserving', name, namespace)
 
     def delete_job(self, name, namespace):
         """Delete the specified job"""
-        api_instance = client.BatchV1Api()
-        api_instance.delete_namespaced_job(
+        self._batch.delete_namespaced_job(
             name,
             namespace,
             client.V1DeleteOptions())
 
     def delete_deployment(self, name, namespace):
-        api_instance = client.ExtensionsV1beta1Api()
-        api_instance.delete_namespaced_deployment(
+        self._apps.delete_namespaced_deployment(
             name,
             namespace,
             client.V1DeleteOptions())
 
     def secret_exists(self, name, namespace):
-        secrets = client.CoreV1Api().list_namespaced_secret(namespace)
-        secret_names = [secret.metadata.name for secret in secrets.items]
-        return name in secret_names
+        """Check whether the named secret exists in the specified namespace"""
+        try:
+            self._core.read_namespaced_secret(name, namespace)
+            return True
+        except client.rest.ApiException as e:
+            if e.status == 404:
+                return False
+            raise
+
+    def list_secret_names(self, namespace):
+        """Yield the name of every secret in the specified namespace.
+
+        The LIST response is streamed and parsed incrementally with ijson
+        so only the metadata.name strings are materialised, instead of
+        deserialising a full V1Secret object per item; peak memory stays
+        flat no matter how many secrets the namespace holds. Requires the
+        optional ijson package.
+        """
+        import ijson
+        resp = self._core.list_namespaced_secret(namespace, _preload_content=False)
+        try:
+            for secret_name in ijson.items(resp, 'items.item.metadata.name'):
+                yield secret_name
+        finally:
+            resp.release_conn()
 
     def create_secret(self, namespace, secret):
-        api_instance = client.CoreV1Api()
-        return api_instance.create_namespaced_secret(namespace, secret)
+        return self._core.create_namespaced_secret(namespace, secret)
 
     def get_service_external_endpoint(self, name, namespace, selectors=None): #pylint:disable=inconsistent-return-statements
-        label_selector_str = ', '.join("{}={}".format(k, v) for (k, v) in selectors.items())
-        v1 = client.CoreV1Api()
-        w = watch.Watch()
+        label_selector_str = format_label_selector(selectors)
+        informer = self._get_service_informer(namespace, label_selector_str)
         print("Waiting for prediction endpoint to come up...")
         try:
-            for event in w.stream(v1.list_namespaced_service,
-                                  namespace=namespace,
-                                  label_selector=label_selector_str):
-                svc = event['object']
-                logger.debug("Event: %s %s",
-                             event['type'],
-                             event['object'])
-                ing = svc.status.load_balancer.ingress
-                if ing is not None and len(ing) > 0: #pylint:disable=len-as-condition
-                    url = "http://{}:5000/predict".format(ing[0].ip or ing[0].hostname)
-                    return url
-        except ValueError as v:
-            logger.error("error getting status for {} {}".format(name, str(v)))
-        except client.rest.ApiException as e:
-            logger.error("error getting status for {} {}".format(name, str(e)))
+            ing = informer.wait_for_ingress(timeout=600)
+            if ing is not None and len(ing) > 0: #pylint:disable=len-as-condition
+                url = "http://{}:5000/predict".format(ing[0].ip or ing[0].hostname)
+                return url
+            if informer.error is not None:
+                logger.error("error getting status for {} {}".format(name, str(informer.error)))
+            else:
+                logger.error("error getting status for {}".format(name))
+        finally:
+            self._release_service_informer(namespace, label_selector_str)
+
+    def _get_service_informer(self, namespace, label_selector_str):
+        """Return the informer for (namespace, selector), starting it if needed.
+
+        Concurrent lookups for the same selector share one informer; it
+        lives until its last lookup releases it. An informer whose watch
+        died is replaced, so one transient outage doesn't poison the
+        cache entry for later deploys.
+        """
+        key = (namespace, label_selector_str)
+        with self._svc_informers_lock:
+            informer = self._svc_informers.get(key)
+            if informer is None or informer.error is not None:
+                informer = _ServiceInformer(self._core, namespace, label_selector_str)
+                self._svc_informers[key] = informer
+            informer.refs += 1
+        return informer
+
+    def _release_service_informer(self, namespace, label_selector_str):
+        """Drop one reference; stop and forget the informer on the last one.
+
+        Deploy selectors usually carry a per-deploy id, so an informer
+        kept past its lookup would never be hit again and would leak its
+        watch thread and connection.
+        """
+        key = (namespace, label_selector_str)
+        with self._svc_informers_lock:
+            informer = self._svc_informers.get(key)
+            if informer is None:
+                return
+            informer.refs -= 1
+            if informer.refs <= 0:
+                del self._svc_informers[key]
+                informer.stop()
+
+    def _watch_pods(self, namespace, label_selector_str, resource_version,
+                    deadline_seconds=600):
+        """Watch pod deltas from resource_version, surviving reconnects.
+
+        Bookmarks keep the tracked resourceVersion fresh without event
+        bodies, so when the connection drops the watch resumes from where
+        it left off instead of re-listing. A 410 Gone (version expired)
+        is recovered with a cheap limit=1 LIST.
+        """
+        v1 = self._core
+        w = watch.Watch()
+        rv = resource_version
+        deadline = time.time() + deadline_seconds
+        while time.time() < deadline:
+            try:
+                for event in w.stream(v1.list_namespaced_pod,
+                                      namespace=namespace,
+                                      label_selector=label_selector_str,
+                                      field_selector='status.phase!=Pending',
+                                      resource_version=rv,
+                                      allow_watch_bookmarks=True,
+                                      timeout_seconds=300):
+                    if event['type'] == 'BOOKMARK':
+                        # Bookmark objects are not deserialized by the
+                        # client; they stay plain dicts.
+                        rv = event['object']['metadata']['resourceVersion']
+                        continue
+                    rv = event['object'].metadata.resource_version
+                    yield event
+            except client.rest.ApiException as e:
+                if e.status != 410:
+                    raise
+                rv = v1.list_namespaced_pod(namespace,
+                                            label_selector=label_selector_str,
+                                            limit=1).metadata.resource_version
 
-    def log(self, name, namespace, selectors=None, container='', follow=True):
+    def _on_pod_pending(self, pod, cs): #pylint:disable=unused-argument
+        logger.warning('Waiting for {} to start...'.format(pod.metadata.name))
+        return None
+
+    def _on_pod_running(self, pod, cs):
+        if cs is not None and cs.ready:
+            logger.info("Pod started running %s", cs.ready)
+            return 'running'
+        if cs is not None and cs.state and cs.state.waiting:
+            return self._on_pod_failed(pod, cs)
+        return None
+
+    def _on_pod_succeeded(self, pod, cs): #pylint:disable=unused-argument
+        logger.info("Pod %s finished running", pod.metadata.name)
+        return 'succeeded'
+
+    def _on_pod_failed(self, pod, cs):
+        terminated = cs.state.terminated if cs is not None and cs.state else None
+        logger.error("Failed to launch %s, reason: %s, message: %s",
+                     pod.metadata.name,
+                     terminated.reason if terminated is not None else None,
+                     terminated.message if terminated is not None else None)
+        return 'failed'
+
+    def _on_pod_other(self, pod, cs):
+        if cs is not None and cs.state and cs.state.waiting:
+            return self._on_pod_failed(pod, cs)
+        return None
+
+    # Dispatch on phase instead of a per-event elif chain; each handler
+    # returns None to keep waiting or the outcome that should start the
+    # log stream.
+    _POD_PHASE_HANDLERS = {
+        'Pending': _on_pod_pending,
+        'Running': _on_pod_running,
+        'Succeeded': _on_pod_succeeded,
+        'Failed': _on_pod_failed,
+    }
+
+    def log(self, name, namespace, selectors=None, container='', follow=True,
+            since_seconds=None, tail_lines=None):
+        """Stream logs for the pod behind the job, bounding bytes fetched.
+
+        since_seconds/tail_lines are passed through to the log request so a
+        reconnect does not re-download the pod's whole history. When
+        since_seconds is not given and this manager has streamed this job
+        before, it is derived from the time the previous stream ended.
+        """
         tail = ''
-        label_selector_str = ', '.join("{}={}".format(k, v) for (k, v) in selectors.items())
-        v1 = client.CoreV1Api()
+        watermark_key = (namespace, name)
+        if since_seconds is None:
+            last_ts = self._log_watermarks.get(watermark_key)
+            if last_ts is not None:
+                since_seconds = max(int(time.time() - last_ts), 1)
+        label_selector_str = format_label_selector(selectors)
+        v1 = self._core
         # Retry to allow starting of pod
-        w = watch.Watch()
         try:
-            for event in w.stream(v1.list_namespaced_pod,
-                                  namespace=namespace,
-                                  label_selector=label_selector_str):
+            # Cheap LIST (limit=1) to pick up existing pods and the current
+            # resourceVersion, then watch deltas from there with Pending
+            # pods filtered server-side instead of re-downloading every
+            # matching pod's full spec on each (re)connect.
+            pods = v1.list_namespaced_pod(namespace,
+                                          label_selector=label_selector_str,
+                                          limit=1)
+            initial_events = ({'type': 'ADDED', 'object': pod} for pod in pods.items)
+            watch_events = self._watch_pods(namespace, label_selector_str,
+                                            pods.metadata.resource_version)
+            for event in itertools.chain(initial_events, watch_events):
+                # Unpack the swagger object chains once per event; watch
+                # streams can fire many events/sec during pod churn and
+                # container_statuses may legitimately be None.
                 pod = event['object']
+                cs = (pod.status.container_statuses or [None])[0]
+                phase = pod.status.phase
+                etype = event['type']
                 logger.debug("Event: %s %s %s",
-                             event['type'],
+                             etype,
                              pod.metadata.name,
-                             pod.status.phase)
-                if pod.status.phase == 'Pending':
-                    logger.warning('Waiting for {} to start...'.format(pod.metadata.name))
+                             phase)
+                if etype == 'DELETED':
+                    outcome = self._on_pod_failed(pod, cs)
+                else:
+                    handler = self._POD_PHASE_HANDLERS.get(phase, KubeManager._on_pod_other)
+                    outcome = handler(self, pod, cs)
+                if outcome is None:
                     continue
-                elif ((pod.status.phase == 'Running'
-                       and pod.status.container_statuses[0].ready)
-                      or pod.status.phase == 'Succeeded'):
-                    logger.info("Pod started running %s",
-                                pod.status.container_statuses[0].ready)
+                if outcome == 'failed':
+                    # The container is gone, so following would hold the
+                    # connection open forever. Its logs are still served
+                    # normally; previous=True would 400 on Job pods with
+                    # restartPolicy Never, where nothing ever restarted.
                     tail = v1.read_namespaced_pod_log(pod.metadata.name,
                                                       namespace,
-                                                      follow=follow,
+                                                      follow=False,
                                                       _preload_content=False,
                                                       pretty='pretty',
-                                                      container=container)
-                    break
-                elif (event['type'] == 'DELETED'
-                      or pod.status.phase == 'Failed'
-                      or pod.status.container_statuses[0].state.waiting):
-                    logger.error("Failed to launch %s, reason: %s, message: %s",
-                                 pod.metadata.name,
-                                 pod.status.container_statuses[0].state.terminated.reason,
-                                 pod.status.container_statuses[0].state.terminated.message)
+                                                      container=container,
+                                                      since_seconds=since_seconds,
+                                                      tail_lines=tail_lines)
+                else:
                     tail = v1.read_namespaced_pod_log(pod.metadata.name,
                                                       namespace,
                                                       follow=follow,
                                                       _preload_content=False,
                                                       pretty='pretty',
-                                                      container=container)
-                    break
+                                                      container=container,
+                                                      since_seconds=since_seconds,
+                                                      tail_lines=tail_lines)
+                break
         except ValueError as v:
             logger.error("error getting status for {} {}".format(name, str(v)))
         except client.rest.ApiException as e:
             logger.error("error getting status for {} {}".format(name, str(e)))
         if tail:
+            # Kubernetes already sends UTF-8 and stdout's buffer is a byte
+            # stream, so pass chunks straight through: no per-chunk decode,
+            # no print() lock/format overhead. Flushing per chunk keeps the
+            # stream interactive and is cheap at 64KB chunks.
+            out = sys.stdout.buffer
             try:
                 for chunk in tail.stream(MAX_STREAM_BYTES):
-                    print(chunk.rstrip().decode('utf8'))
+                    out.write(chunk)
+                    out.flush()
             finally:
                 tail.release_conn()
+                self._log_watermarks[watermark_key] = time.time()
@@ -1,10 +1,23 @@
-from kubernetes import client
-from kubernetes.client.models.v1_resource_requirements import V1ResourceRequirements
 from fairing.constants import constants
 
 
+def format_label_selector(selectors):
+    """Serialise a label dict into the API's selector string.
+
+    Callers that already hold a formatted selector string (e.g. computed
+    once at job-creation time) can pass it through unchanged, avoiding
+    re-serialising the same dict on every log/watch call.
+    """
+    if isinstance(selectors, str):
+        return selectors
+    return ",".join(f"{k}={v}" for k, v in selectors.items())
+
+
 def get_resource_mutator(cpu=None, memory=None):
     def _resource_mutator(kube_manager, pod_spec, namespace): #pylint:disable=unused-argument
+        # Imported here so `import fairing` doesn't pay for the large
+        # kubernetes package unless a mutator actually runs.
+        from kubernetes.client.models.v1_resource_requirements import V1ResourceRequirements
         if cpu is None and memory is None:
             return
         if pod_spec.containers and len(pod_spec.containers) >= 1:
@@ -31,6 +44,7 @@ def mounting_pvc(pvc_name, pvc_mount_path=constants.PVC_DEFAULT_MOUNT_PATH):
     '''The function for pod_spec_mutators to mount persistent volume claim'''
     mounting_name = str(constants.PVC_DEFAULT_VOLUME_NAME) + pvc_name
     def _mounting_pvc(kube_manager, pod_spec, namespace): #pylint:disable=unused-argument
+        from kubernetes import client
         volume_mount = client.V1VolumeMount(
             name=mounting_name, mount_path=pvc_mount_path)
         if pod_spec.containers[0].volume_mounts:
@@ -23,10 +23,17 @@ setuptools.setup(
     ),
     install_requires=requirements,
     extras_require={
+        'async': [
+            'kubernetes-asyncio>=24.2.0'
+        ],
+        'ijson': [
+            'ijson>=2.4'
+        ],
         'dev': [
             'pytest',
             'pytest-pep8',
-            'pytest-cov'
+            'pytest-cov',
+            'ijson>=2.4'
         ]
     }
 )
@@ -0,0 +1,106 @@
+import io
+import json
+from unittest import mock
+
+import pytest
+
+import fairing.kubernetes.manager as manager_module
+from fairing.kubernetes.manager import KubeManager
+
+
+def test_watch_pods_skips_bookmark_events(monkeypatch):
+    manager_module._load_kubernetes()
+    pod = mock.Mock()
+    pod.metadata.resource_version = '7'
+    bookmark = {'type': 'BOOKMARK',
+                'object': {'kind': 'Pod',
+                           'metadata': {'resourceVersion': '5'}}}
+    modified = {'type': 'MODIFIED', 'object': pod}
+    fake_watch = mock.Mock()
+    fake_watch.stream.side_effect = [
+        iter([bookmark, modified]),
+        manager_module.client.rest.ApiException(status=500),
+    ]
+    monkeypatch.setattr(manager_module, 'watch',
+                        mock.Mock(Watch=mock.Mock(return_value=fake_watch)))
+    manager = KubeManager.__new__(KubeManager)
+    manager._core = mock.Mock()
+
+    received = []
+    with pytest.raises(manager_module.client.rest.ApiException):
+        for event in manager._watch_pods('default', 'fairing-id=123', '1'):
+            received.append(event)
+
+    assert received == [modified]
+    # The bookmark's resourceVersion must be picked up for the reconnect.
+    assert fake_watch.stream.call_args.kwargs['resource_version'] == '7'
+
+
+def test_kube_manager_constructs_against_installed_client(monkeypatch):
+    manager_module._load_kubernetes()
+    monkeypatch.setattr(manager_module, 'is_running_in_k8s', lambda: True)
+    monkeypatch.setattr(manager_module.config, 'load_incluster_config',
+                        lambda: None)
+    # Exercises the real API constructors so removed API groups
+    # (e.g. extensions/v1beta1) fail here instead of at deploy time.
+    manager = KubeManager()
+    assert manager._apps is not None
+
+
+def test_service_informer_surfaces_terminal_error(monkeypatch):
+    manager_module._load_kubernetes()
+    monkeypatch.setattr(manager_module.time, 'sleep', lambda s: None)
+    api_instance = mock.Mock()
+    api_instance.list_namespaced_service.side_effect = \
+        manager_module.client.rest.ApiException(status=500)
+
+    informer = manager_module._ServiceInformer(api_instance, 'default', 'a=b')
+    ing = informer.wait_for_ingress(timeout=10)
+
+    assert ing is None
+    assert isinstance(informer.error, manager_module.client.rest.ApiException)
+
+
+def test_endpoint_lookup_releases_its_informer(monkeypatch):
+    manager_module._load_kubernetes()
+    informer = mock.Mock()
+    informer.error = None
+    informer.refs = 0
+    informer.wait_for_ingress.return_value = None
+    monkeypatch.setattr(manager_module, '_ServiceInformer',
+                        mock.Mock(return_value=informer))
+    manager = KubeManager.__new__(KubeManager)
+    manager._core = mock.Mock()
+    manager._svc_informers = {}
+    manager._svc_informers_lock = manager_module.threading.Lock()
+
+    manager.get_service_external_endpoint('svc', 'default', {'fairing-id': '123'})
+
+    informer.stop.assert_called_once_with()
+    assert manager._svc_informers == {}
+
+
+class _FakeListResponse(io.BytesIO):
+    def __init__(self, payload):
+        super().__init__(json.dumps(payload).encode('utf8'))
+        self.released = False
+
+    def release_conn(self):
+        self.released = True
+
+
+def test_list_secret_names_streams_without_full_deserialisation():
+    pytest.importorskip('ijson')
+    payload = {'items': [{'metadata': {'name': 'secret-{}'.format(i)}}
+                         for i in range(3)]}
+    resp = _FakeListResponse(payload)
+    manager = KubeManager.__new__(KubeManager)
+    manager._core = mock.Mock()
+    manager._core.list_namespaced_secret.return_value = resp
+
+    names = list(manager.list_secret_names('default'))
+
+    assert names == ['secret-0', 'secret-1', 'secret-2']
+    manager._core.list_namespaced_secret.assert_called_once_with(
+        'default', _preload_content=False)
+    assert resp.released
@@ -34,3 +34,13 @@ def test_resource_mutator_no_mem():
     actual = pod_spec.containers[0].resources.limits
     expected = {'cpu': 1.5}
     assert actual == expected
+
+
+def test_format_label_selector():
+    selectors = {'fairing-job': 'fairing-job-abc', 'fairing-id': '123'}
+    actual = k8s_utils.format_label_selector(selectors)
+    assert actual == 'fairing-job=fairing-job-abc,fairing-id=123'
+
+
+def test_format_label_selector_passthrough():
+    assert k8s_utils.format_label_selector('app=fairing') == 'app=fairing'